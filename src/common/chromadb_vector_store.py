@@ -1,21 +1,41 @@
+from functools import lru_cache
 from typing import Any
 
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
 from langchain_huggingface import HuggingFaceEmbeddings
 
-from common.vector_store import VectorStore
 
+@lru_cache(maxsize=4)
+def _get_embeddings(model_name: str, batch_size: int) -> HuggingFaceEmbeddings:
+    """Load an embedding model once per process; instances are read-only after init."""
+    return HuggingFaceEmbeddings(model_name=model_name, encode_kwargs={"batch_size": batch_size})
 
-class ChromaDbVectorStore(VectorStore):
+
+# Chroma `where` clauses, built once instead of per retriever/search call
+_NOT_DELETED: dict[str, Any] = {"deleted": False}
+_SOURCE_FILTERS: dict[str, dict[str, Any]] = {
+    source: {"$and": [{"source": source}, _NOT_DELETED]} for source in ("obsidian", "Gmail")
+}
+
+
+def _source_filter(source: str) -> dict[str, Any]:
+    if not source:
+        return _NOT_DELETED
+    return _SOURCE_FILTERS.get(source) or {"$and": [{"source": source}, _NOT_DELETED]}
+
+
+class ChromaDbVectorStore:
     def __init__(
         self,
         persist_directory: str = "./chroma_db",
         embedding_model: str | None = None,
+        embed_batch_size: int = 128,
     ):
         self.persist_directory = persist_directory
         self.embedding_model = embedding_model or "sentence-transformers/all-mpnet-base-v2"
-        self.embeddings = HuggingFaceEmbeddings(model_name=self.embedding_model)
+        self.embed_batch_size = embed_batch_size
+        self.embeddings = _get_embeddings(self.embedding_model, self.embed_batch_size)
         self.db: Chroma | None = None
 
     def from_documents(self, documents: list, **kwargs):
@@ -42,56 +62,35 @@ class ChromaDbVectorStore(VectorStore):
         )
         return self
 
-    def as_retriever(self, **kwargs):
+    def _retriever(self, where: dict[str, Any], **kwargs):
         if self.db is None:
             raise ValueError("Vector store is not loaded.")
-        # Add a default filter to exclude deleted items
-        filter_func = kwargs.pop("filter_func", None)
-
-        def not_deleted_filter(doc):
-            return not doc.metadata.get("deleted", False)
-
-        if filter_func:
+        search_kwargs = {**kwargs.pop("search_kwargs", {}), "filter": where}
+        return self.db.as_retriever(search_kwargs=search_kwargs, **kwargs)
 
-            def combined_filter(doc):
-                return not_deleted_filter(doc) and filter_func(doc)
-
-            kwargs["filter_func"] = combined_filter
-        else:
-            kwargs["filter_func"] = not_deleted_filter
-        return self.db.as_retriever(**kwargs)
+    def as_retriever(self, **kwargs):
+        # Exclude deleted items in Chroma's `where` clause rather than post-filtering
+        extra_filter = kwargs.get("search_kwargs", {}).get("filter")
+        where = {"$and": [extra_filter, _NOT_DELETED]} if extra_filter else _NOT_DELETED
+        return self._retriever(where, **kwargs)
 
     def get_notes_retriever(self, **kwargs):
         """Return a retriever that only searches notes (source == 'obsidian')."""
-
-        def notes_filter(doc):
-            return doc.metadata.get("source") == "obsidian" and not doc.metadata.get(
-                "deleted", False
-            )
-
-        return self.as_retriever(filter_func=notes_filter, **kwargs)
+        return self._retriever(_SOURCE_FILTERS["obsidian"], **kwargs)
 
     def get_gmail_retriever(self, **kwargs):
         """Return a retriever that only searches Gmail (source == 'Gmail')."""
-
-        def gmail_filter(doc):
-            return doc.metadata.get("source") == "Gmail" and not doc.metadata.get("deleted", False)
-
-        return self.as_retriever(filter_func=gmail_filter, **kwargs)
+        return self._retriever(_SOURCE_FILTERS["Gmail"], **kwargs)
 
     def similarity_search_with_distance(
         self, query: str, k: int = 5, source: str = "", score_threshold: float = 0.2
     ) -> list[tuple[Document, float]]:
         """Return top-k (Document, distance) tuples for notes (obsidian only)."""
         # Use the underlying Chroma API for similarity search with scores
-        # Filter for obsidian notes only
-        filter: dict[str, Any] = {"deleted": False}
-        if source:
-            filter = {"$and": [{"source": source}, {"deleted": False}]}
         if self.db is None:
             raise ValueError("Vector store is not loaded.")
         # Chroma's similarity_search_with_relevance_scores returns (doc, score) pairs
         results = self.db.similarity_search_with_relevance_scores(
-            query, k=k, filter=filter, score_threshold=score_threshold
+            query, k=k, filter=_source_filter(source), score_threshold=score_threshold
         )
         return results
@@ -10,10 +10,37 @@ from common.load_settings import load_settings
 settings = load_settings()
 SQLITE_DB = settings["index_tracker_sqlite_db"]
 
+# WAL lets readers proceed during an indexing run and needs one fsync per commit
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
 
-def init_db():
-    conn = sqlite3.connect(os.path.join(DATA_DIR, SQLITE_DB))
-    c = conn.cursor()
+# Hot-path statements, kept as constants so sqlite3's statement cache always hits
+_SQL_GET_FILE_RECORD = "SELECT hash, deleted, size, mtime_ns FROM file_index WHERE item = ?"
+_SQL_UPSERT_FILE_RECORD = (
+    "INSERT INTO file_index "
+    "(source, item, hash, created_at, updated_at, deleted, size, mtime_ns) "
+    "VALUES (?, ?, ?, ?, ?, 0, ?, ?) "
+    "ON CONFLICT(item) DO UPDATE SET hash=excluded.hash, "
+    "updated_at=excluded.updated_at, deleted=0, size=excluded.size, "
+    "mtime_ns=excluded.mtime_ns"
+)
+_SQL_UPSERT_FILE_RECORD_WITH_META = (
+    "INSERT INTO file_index "
+    "(source, item, hash, created_at, updated_at, deleted, size, mtime_ns, account, item_date) "
+    "VALUES (?, ?, ?, ?, ?, 0, ?, ?, ?, ?) "
+    "ON CONFLICT(item) DO UPDATE SET hash=excluded.hash, "
+    "updated_at=excluded.updated_at, deleted=0, size=excluded.size, "
+    "mtime_ns=excluded.mtime_ns, account=excluded.account, item_date=excluded.item_date"
+)
+_SQL_MARK_DELETED = "UPDATE file_index SET deleted=1 WHERE item=?"
+_SQL_GET_ALL_ITEMS = "SELECT item FROM file_index WHERE deleted=0"
+
+
+def _migrate_v0_to_v1(c):
     # Add new fields for email tracking if not present
     c.execute(
         """
@@ -38,61 +65,97 @@ def init_db():
         c.execute("ALTER TABLE file_index ADD COLUMN item_date TEXT")
     except sqlite3.OperationalError:
         pass
-    conn.commit()
+
+
+def _migrate_v1_to_v2(c):
+    # Stat snapshot so unchanged files can be skipped without re-hashing; another
+    # process may have migrated the same file concurrently, so tolerate existing columns
+    try:
+        c.execute("ALTER TABLE file_index ADD COLUMN size INTEGER")
+    except sqlite3.OperationalError:
+        pass
+    try:
+        c.execute("ALTER TABLE file_index ADD COLUMN mtime_ns INTEGER")
+    except sqlite3.OperationalError:
+        pass
+
+
+# Schema upgrades keyed on the version they start from; bump SCHEMA_VERSION with each
+_MIGRATIONS = {
+    0: _migrate_v0_to_v1,
+    1: _migrate_v1_to_v2,
+}
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+
+def init_db():
+    conn = sqlite3.connect(os.path.join(DATA_DIR, SQLITE_DB))
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    # Skip the DDL entirely once the database is at the current schema version
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < SCHEMA_VERSION:
+        c = conn.cursor()
+        for from_version in range(version, SCHEMA_VERSION):
+            _MIGRATIONS[from_version](c)
+        c.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        conn.commit()
     return conn
 
 
+def close_db(conn):
+    """Refresh planner statistics and close; closing also checkpoints and removes the WAL."""
+    conn.execute("PRAGMA optimize")
+    conn.close()
+
+
 def get_file_record(conn, item):
-    c = conn.cursor()
-    c.execute("SELECT hash, deleted FROM file_index WHERE item = ?", (item,))
-    return c.fetchone()
+    return conn.execute(_SQL_GET_FILE_RECORD, (item,)).fetchone()
 
 
-def upsert_file_record(conn, source, item, hash_value, account=None, item_date=None):
+def upsert_file_record(
+    conn, source, item, hash_value, account=None, item_date=None, size=None, mtime_ns=None
+):
     now = datetime.now().isoformat()
-    c = conn.cursor()
     # If account/item_date are provided, use them; otherwise, fallback to old logic
     if account is not None or item_date is not None:
-        c.execute(
-            """
-            INSERT INTO file_index (source, item, hash, created_at, updated_at, deleted, account, item_date)
-            VALUES (?, ?, ?, ?, ?, 0, ?, ?)
-            ON CONFLICT(item) DO UPDATE SET hash=excluded.hash, \
-            updated_at=excluded.updated_at, deleted=0, account=excluded.account, item_date=excluded.item_date
-            """,
-            (source, item, hash_value, now, now, account, item_date),
+        conn.execute(
+            _SQL_UPSERT_FILE_RECORD_WITH_META,
+            (source, item, hash_value, now, now, size, mtime_ns, account, item_date),
         )
     else:
-        c.execute(
-            """
-            INSERT INTO file_index (source, item, hash, created_at, updated_at, deleted)
-            VALUES (?, ?, ?, ?, ?, 0)
-            ON CONFLICT(item) DO UPDATE SET hash=excluded.hash, \
-            updated_at=excluded.updated_at, deleted=0
-            """,
-            (source, item, hash_value, now, now),
-        )
+        conn.execute(_SQL_UPSERT_FILE_RECORD, (source, item, hash_value, now, now, size, mtime_ns))
     conn.commit()
 
 
+def upsert_file_records(conn, records):
+    """Upsert (source, item, hash, size, mtime_ns) records in a single transaction."""
+    now = datetime.now().isoformat()
+    with conn:
+        conn.executemany(
+            _SQL_UPSERT_FILE_RECORD,
+            (
+                (source, item, hash_value, now, now, size, mtime_ns)
+                for source, item, hash_value, size, mtime_ns in records
+            ),
+        )
+
+
 def mark_deleted(conn, item):
-    c = conn.cursor()
-    c.execute("UPDATE file_index SET deleted=1 WHERE item=?", (item,))
+    conn.execute(_SQL_MARK_DELETED, (item,))
     conn.commit()
 
 
+def mark_deleted_items(conn, items):
+    with conn:
+        conn.executemany(_SQL_MARK_DELETED, ((item,) for item in items))
+
+
 def get_all_items(conn):
-    c = conn.cursor()
-    c.execute("SELECT item FROM file_index WHERE deleted=0")
-    return set(row[0] for row in c.fetchall())
+    return set(row[0] for row in conn.execute(_SQL_GET_ALL_ITEMS))
 
 
 def hash_file(path):
-    h = xxhash.xxh64()
     with open(path, "rb") as f:
-        while True:
-            chunk = f.read(8192)
-            if not chunk:
-                break
-            h.update(chunk)
-    return h.hexdigest()
+        # Notes are small, so one read and one hash call beats a chunked loop
+        return xxhash.xxh64(f.read()).hexdigest()
@@ -28,7 +28,8 @@ def get_vector_store_config() -> tuple[VectorDbType, dict]:
     # Validate db_type
     if db_type not in vector_db_config_defaults:
         raise ValueError(f"Unknown db_type: {db_type}")
-    config = vector_db_config_defaults[db_type]
+    config = dict(vector_db_config_defaults[db_type])
+    config["embed_batch_size"] = settings["embed_batch_size"]
     config.update(settings.get(db_type, {}))
     return db_type, config
 
@@ -1,13 +1,19 @@
 import os
+from functools import cache
+from types import MappingProxyType
 
 
+@cache
 def load_settings():
-    """Load settings from environment variables"""
-    return {
+    """Load settings from environment variables (read once per process)"""
+    settings = {
         "github_token": os.environ.get("GITHUB_TOKEN"),
         "obsidian_notes_path": os.environ.get("OBSIDIAN_NOTES_PATH", "notes"),
         "chunk_size": int(os.environ.get("CHUNK_SIZE", 1000)),
         "chunk_overlap": int(os.environ.get("CHUNK_OVERLAP", 200)),
+        "embed_batch_size": int(os.environ.get("EMBED_BATCH_SIZE", 128)),
+        "index_workers": int(os.environ.get("INDEX_WORKERS", 8)),
+        "index_batch_size": int(os.environ.get("INDEX_BATCH_SIZE", 512)),
         "index_tracker_sqlite_db": os.environ.get(
             "INDEX_TRACKER_SQLITE_DB", "index_tracker.sqlite3"
         ),
@@ -16,3 +22,5 @@ def load_settings():
         ),
         "vector_db_type": os.environ.get("VECTOR_DB_TYPE", "chromadb"),
     }
+    # Every caller shares the cached mapping, so hand out a read-only view of it
+    return MappingProxyType(settings)
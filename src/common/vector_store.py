@@ -1,33 +1,19 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 
-class VectorStore(ABC):
-    @abstractmethod
-    def from_documents(self, documents: list, **kwargs):
-        pass
+class VectorStore(Protocol):
+    def from_documents(self, documents: list, **kwargs): ...
 
-    @abstractmethod
-    def add_documents(self, documents: list, **kwargs):
-        pass
+    def add_documents(self, documents: list, **kwargs): ...
 
-    @abstractmethod
-    def load(self):
-        pass
+    def load(self): ...
 
-    @abstractmethod
-    def as_retriever(self, **kwargs):
-        pass
+    def as_retriever(self, **kwargs): ...
 
-    @abstractmethod
-    def get_notes_retriever(self, **kwargs):
-        pass
+    def get_notes_retriever(self, **kwargs): ...
 
-    @abstractmethod
-    def get_gmail_retriever(self, **kwargs):
-        pass
+    def get_gmail_retriever(self, **kwargs): ...
 
-    @abstractmethod
     def similarity_search_with_distance(
         self, query: str, k: int = 5, source: str = "", score_threshold: float = 0.2
-    ):
-        pass
+    ): ...
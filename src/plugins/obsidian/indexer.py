@@ -1,17 +1,19 @@
-import glob
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.document_loaders import TextLoader
 
 from common.data import DATA_DIR, refresh_data
 from common.db_utils import (
+    close_db,
     get_all_items,
     get_file_record,
     hash_file,
     init_db,
-    mark_deleted,
-    upsert_file_record,
+    mark_deleted_items,
+    upsert_file_records,
 )
 from common.get_vector_store import get_vector_store_from_config
 from common.load_settings import load_settings
@@ -19,35 +21,81 @@ from common.load_settings import load_settings
 settings = load_settings()
 OBSIDIAN_NOTES_PATH = settings["obsidian_notes_path"]
 OBSIDIAN_REPO_URL = settings["obsidian_repo_url"]
+INDEX_WORKERS = settings["index_workers"]
+INDEX_BATCH_SIZE = settings["index_batch_size"]
 
+logger = logging.getLogger(__name__)
 
-def index_obsidian(conn):
+# Non-hidden directories that never hold notes
+_SKIP_DIRS = frozenset({"node_modules"})
+
+
+def _walk_md(root):
+    """Yield markdown file paths under root using a single scandir traversal."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            # Hidden entries (.git, .obsidian, dotfiles) are not notes
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP_DIRS:
+                    yield from _walk_md(entry.path)
+            elif entry.name.endswith(".md"):
+                yield entry.path
+
+
+def _hash_and_load(file_path, known_hash):
+    """Hash a note and load it only if its content changed; runs on a worker thread."""
+    file_hash = hash_file(file_path)
+    if file_hash == known_hash:
+        return file_hash, None, None
+    try:
+        loader = TextLoader(file_path, encoding="utf-8")
+        return file_hash, loader.load(), None
+    except Exception as e:
+        return file_hash, None, e
+
+
+def index_obsidian(conn, file_paths=None):
     notes_path = os.path.join(DATA_DIR, OBSIDIAN_NOTES_PATH)
     """Index Obsidian markdown notes and track in the DB."""
     documents = []
-    pattern = os.path.join(notes_path, "**/*.md")
-    total_files = len(list(glob.glob(pattern, recursive=True)))
+    records = []
+    if file_paths is None:
+        file_paths = list(_walk_md(notes_path))
+    total_files = len(file_paths)
     print(f"Found {total_files} markdown files")
-    for i, file_path in enumerate(glob.glob(pattern, recursive=True), 1):
+    # DB lookups stay on this thread; only hashing and file reads go to the pool
+    pending = []
+    for file_path in file_paths:
         rel_path = os.path.relpath(file_path, notes_path)
-        file_hash = hash_file(file_path)
+        st = os.stat(file_path)
         rec = get_file_record(conn, rel_path)
-        if rec and rec[0] == file_hash and rec[1] == 0:
-            # Unchanged and not deleted
+        if rec and rec[1] == 0 and (rec[2], rec[3]) == (st.st_size, st.st_mtime_ns):
+            # Same size and mtime as last run; skip reading the file
             continue
-        try:
-            loader = TextLoader(file_path, encoding="utf-8")
-            loaded_docs = loader.load()
+        known_hash = rec[0] if rec and rec[1] == 0 else None
+        pending.append((file_path, rel_path, st, known_hash))
+    with ThreadPoolExecutor(max_workers=INDEX_WORKERS) as pool:
+        results = pool.map(_hash_and_load, [p[0] for p in pending], [p[3] for p in pending])
+        for i, ((file_path, rel_path, st, _), (file_hash, loaded_docs, error)) in enumerate(
+            zip(pending, results), 1
+        ):
+            if error is not None:
+                logger.error(f"Error loading {file_path}: {str(error)}")
+                continue
+            records.append(("obsidian", rel_path, file_hash, st.st_size, st.st_mtime_ns))
+            if loaded_docs is None:
+                # Content unchanged and not deleted; only the new stat needs recording
+                continue
             for doc in loaded_docs:
                 doc.metadata["source"] = "obsidian"
                 doc.metadata["item"] = rel_path
                 doc.metadata["deleted"] = False
             documents.extend(loaded_docs)
-            upsert_file_record(conn, "obsidian", rel_path, file_hash)
-            print(f"[{i}/{total_files}] Indexed: {rel_path}")
-        except Exception as e:
-            print(f"Error loading {file_path}: {str(e)}")
-            continue
+            print(f"[{i}/{len(pending)}] Indexed: {rel_path}")
+    # One transaction for the whole run instead of a commit per file
+    upsert_file_records(conn, records)
     return documents
 
 
@@ -55,23 +103,23 @@ def run_index():
     notes_path = os.path.join(DATA_DIR, OBSIDIAN_NOTES_PATH)
     refresh_data(OBSIDIAN_REPO_URL, notes_path)
     if not os.path.exists(notes_path):
-        print(f"Error: Notes directory not found at {notes_path}")
+        logger.error(f"Notes directory not found at {notes_path}")
         return
     print(f"Loading documents from {notes_path}...")
     conn = init_db()
-    # Track all current files
-    current_files = set()
-    pattern = os.path.join(notes_path, "**/*.md")
-    for file_path in glob.glob(pattern, recursive=True):
-        rel_path = os.path.relpath(file_path, notes_path)
-        current_files.add(rel_path)
-    # Mark deleted files
-    indexed_files = get_all_items(conn)
-    for item in indexed_files - current_files:
-        mark_deleted(conn, item)
-        print(f"Marked deleted: {item}")
-    # Load and index new/changed files (Obsidian)
-    documents = index_obsidian(conn)
+    try:
+        # Track all current files
+        file_paths = list(_walk_md(notes_path))
+        current_files = {os.path.relpath(file_path, notes_path) for file_path in file_paths}
+        # Mark deleted files
+        deleted_files = get_all_items(conn) - current_files
+        mark_deleted_items(conn, deleted_files)
+        for item in deleted_files:
+            print(f"Marked deleted: {item}")
+        # Load and index new/changed files (Obsidian)
+        documents = index_obsidian(conn, file_paths)
+    finally:
+        close_db(conn)
     print(f"Loaded {len(documents)} new or changed documents")
     if not documents:
         print("No new or changed documents to index.")
@@ -87,21 +135,12 @@ def run_index():
     # Initialize vector store
     print("Initializing vector store...")
     vector_store = get_vector_store_from_config()
-    # Add documents in batches with progress reporting
-    batch_size = 100
+    # Add documents in batches with progress reporting; keep this a multiple of the
+    # embedding batch size so each add fills whole encoder batches
     total = len(chunks)
     print("Adding documents to vector store in batches...")
-    for i in range(0, total, batch_size):
-        batch = chunks[i : i + batch_size]
+    for i in range(0, total, INDEX_BATCH_SIZE):
+        batch = chunks[i : i + INDEX_BATCH_SIZE]
         vector_store.add_documents(batch)
-        print(f"Added {min(i + batch_size, total)}/{total} chunks")
+        print(f"Added {min(i + INDEX_BATCH_SIZE, total)}/{total} chunks")
     print("Database updated successfully!")
-
-
-def get_full_note_text(item_relative_path):
-    note_path = os.path.join(DATA_DIR, OBSIDIAN_NOTES_PATH, item_relative_path)
-    try:
-        with open(note_path) as f:
-            return f.read()
-    except Exception as e:
-        return f"[Error reading note: {e}]"
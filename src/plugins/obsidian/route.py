@@ -1,15 +1,35 @@
-from fastapi import APIRouter
+import logging
+import threading
+
+from fastapi import APIRouter, BackgroundTasks
 from fastapi.responses import JSONResponse
 
 from plugins.obsidian.indexer import run_index
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
+# Held for the duration of a run so concurrent requests don't index the same vault twice
+_index_lock = threading.Lock()
 
-@router.get("/index")
-def obsidian_index():
+
+def _run_index_locked():
     try:
         run_index()
-        return JSONResponse({"status": "success", "message": "Obsidian index completed."})
-    except Exception as e:
-        return JSONResponse({"status": "error", "message": str(e)}, status_code=500)
+    except Exception:
+        logger.exception("Obsidian index failed")
+    finally:
+        _index_lock.release()
+
+
+@router.get("/index")
+def obsidian_index(background_tasks: BackgroundTasks):
+    if not _index_lock.acquire(blocking=False):
+        return JSONResponse(
+            {"status": "running", "message": "Obsidian index already in progress."},
+            status_code=409,
+        )
+    background_tasks.add_task(_run_index_locked)
+    return JSONResponse(
+        {"status": "accepted", "message": "Obsidian index started."}, status_code=202
+    )
@@ -1,4 +1,6 @@
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from langchain_core.tools import tool
 
@@ -16,6 +18,11 @@ os.environ["TOKENIZERS_PARALLELISM"] = "false"
 settings = load_settings()
 OBSIDIAN_NOTES_PATH = settings["obsidian_notes_path"]
 
+logger = logging.getLogger(__name__)
+
+# Shared across calls and capped, since k (and so the hit count) is chosen by the model
+_read_pool = ThreadPoolExecutor(max_workers=settings["index_workers"])
+
 
 def get_full_note_text(item_relative_path):
     note_path = os.path.join(DATA_DIR, OBSIDIAN_NOTES_PATH, item_relative_path)
@@ -31,7 +38,7 @@ def search_notes(query: str, k: int = 5) -> list[SearchResult]:
     """Search the user's notes for relevant information."""
     keywords = strToKeywords(query)
     keywords_str = " ".join(keywords)
-    print(f'Searching for: "{keywords_str}"')
+    logger.info(f'Searching for: "{keywords_str}"')
 
     vector_store = load_db()
     # First get results with distances
@@ -39,17 +46,23 @@ def search_notes(query: str, k: int = 5) -> list[SearchResult]:
         keywords_str, k=k, source="obsidian", score_threshold=0.5
     )
     results = deduplicate_documents(results)
+    if not results:
+        return []
+
+    # Read the matching notes concurrently instead of one blocking open() per hit
+    items = [doc.metadata.get("item", "") for doc, _ in results]
+    full_texts = list(_read_pool.map(get_full_note_text, items))
 
     # Return a list of SearchResult objects
     return [
         SearchResult(
-            item=doc.metadata.get("item", ""),
+            item=item,
             bucket=doc.metadata.get("bucket", ""),
             source=doc.metadata.get("source", ""),
             document=doc,
             distance=distance,
             metadata=getattr(doc, "metadata", {}),
-            full_text=get_full_note_text(doc.metadata.get("item", "")),
+            full_text=full_text,
         )
-        for doc, distance in results
+        for (doc, distance), item, full_text in zip(results, items, full_texts)
     ]
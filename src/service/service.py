@@ -280,7 +280,9 @@ async def message_generator(
                 # LangGraph re-sends the input message, which feels weird, so drop it
                 if chat_message.type == "human" and chat_message.content == user_input.message:
                     continue
-                yield f"data: {json.dumps({'type': 'message', 'content': chat_message.model_dump()})}\n\n"
+                # Serialize the message once in pydantic-core instead of dict + json.dumps
+                content_json = chat_message.model_dump_json()
+                yield f'data: {{"type": "message", "content": {content_json}}}\n\n'
 
             if stream_mode == "messages":
                 if not user_input.stream_tokens:
@@ -1,6 +1,9 @@
+import logging
 import os
 import subprocess
 
+logger = logging.getLogger(__name__)
+
 
 def ensure_git_repo(path: str, repo_url: str, branch: str | None = None, token: str | None = None):
     """
@@ -22,7 +25,7 @@ def ensure_git_repo(path: str, repo_url: str, branch: str | None = None, token:
                 subprocess.run(["git", "-C", path, "checkout", branch], check=True)
                 subprocess.run(["git", "-C", path, "pull", "origin", branch], check=True)
         except subprocess.CalledProcessError as e:
-            print(f"Error pulling repo: {e}")
+            logger.error(f"Error pulling repo: {e}")
     else:
         # Repo does not exist, clone it
         try:
@@ -36,4 +39,4 @@ def ensure_git_repo(path: str, repo_url: str, branch: str | None = None, token:
                 clone_cmd += ["-b", branch]
             subprocess.run(clone_cmd, check=True)
         except subprocess.CalledProcessError as e:
-            print(f"Error cloning repo: {e}")
+            logger.error(f"Error cloning repo: {e}")
@@ -1,21 +1,30 @@
+from functools import cache, lru_cache
+
 import nltk  # type: ignore
 from rake_nltk import Rake  # type: ignore
 
-nltk.download("stopwords", quiet=True)
 
-# Optionally, you can specify your own stopwords file or use the built-in one
-# rake = Rake('path/to/stopwords.txt')
-rake = Rake()
+@cache
+def _get_rake() -> Rake:
+    """Build the shared RAKE extractor on first use rather than at import time."""
+    # nltk.download may hit the network, so only pay for it when keywords are needed
+    nltk.download("stopwords", quiet=True)
+    # Optionally, you can specify your own stopwords file or use the built-in one
+    # return Rake('path/to/stopwords.txt')
+    return Rake()
 
 
-def strToKeywords(text: str) -> list[str]:
+@lru_cache(maxsize=1024)
+def strToKeywords(text: str) -> tuple[str, ...]:
     """
     Extract keywords from a string using the RAKE algorithm.
+    Results are memoized, since agent loops often repeat the same query.
     Args:
         text (str): The input string.
     Returns:
-        List[str]: A list of extracted keywords, sorted by relevance.
+        Tuple[str, ...]: The extracted keywords, sorted by relevance.
     """
+    rake = _get_rake()
     rake.extract_keywords_from_text(text)
     # rake.get_ranked_phrases() returns a list of keywords sorted by score
-    return rake.get_ranked_phrases()
+    return tuple(rake.get_ranked_phrases())
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from langchain_core.documents import Document
 from pydantic import BaseModel
 
@@ -39,7 +41,9 @@ def deduplicate_documents(documents):
     return unique_docs
 
 
+@lru_cache(maxsize=1)
 def load_db():
+    """Return the shared, loaded vector store; opened once per process."""
     vector_store = get_vector_store_from_config()
     vector_store.load()
     return vector_store
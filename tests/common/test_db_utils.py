@@ -0,0 +1,112 @@
+import os
+import sqlite3
+
+import pytest
+
+from common import db_utils
+
+LEGACY_SCHEMA = """
+    CREATE TABLE file_index (
+        source TEXT,
+        item TEXT PRIMARY KEY,
+        hash TEXT,
+        created_at TEXT,
+        updated_at TEXT,
+        deleted INTEGER DEFAULT 0
+    )
+"""
+
+
+@pytest.fixture
+def db_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_utils, "DATA_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _columns(conn):
+    return {row[1] for row in conn.execute("PRAGMA table_info(file_index)")}
+
+
+def test_init_db_upgrades_legacy_table(db_dir) -> None:
+    legacy = sqlite3.connect(db_dir / db_utils.SQLITE_DB)
+    legacy.execute(LEGACY_SCHEMA)
+    legacy.execute("INSERT INTO file_index VALUES ('obsidian', 'a.md', 'abc', 't0', 't0', 0)")
+    legacy.commit()
+    legacy.close()
+
+    conn = db_utils.init_db()
+    try:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == db_utils.SCHEMA_VERSION
+        assert {"account", "item_date", "size", "mtime_ns"} <= _columns(conn)
+        assert db_utils.get_file_record(conn, "a.md") == ("abc", 0, None, None)
+    finally:
+        db_utils.close_db(conn)
+
+
+def test_init_db_tolerates_concurrent_v1_migration(db_dir) -> None:
+    # Another process already added the v2 columns but this one still read user_version=1
+    conn = sqlite3.connect(db_dir / db_utils.SQLITE_DB)
+    db_utils._migrate_v0_to_v1(conn.cursor())
+    db_utils._migrate_v1_to_v2(conn.cursor())
+    conn.execute("PRAGMA user_version=1")
+    conn.commit()
+    conn.close()
+
+    conn = db_utils.init_db()
+    try:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == db_utils.SCHEMA_VERSION
+    finally:
+        db_utils.close_db(conn)
+
+
+@pytest.fixture
+def vault(db_dir, monkeypatch):
+    indexer = pytest.importorskip("plugins.obsidian.indexer")
+    monkeypatch.setattr(indexer, "DATA_DIR", str(db_dir))
+    notes_path = db_dir / indexer.OBSIDIAN_NOTES_PATH
+    notes_path.mkdir()
+    note = notes_path / "note.md"
+    note.write_text("# Note\n\nHello")
+
+    hashed = []
+
+    def counting_hash_file(path):
+        hashed.append(path)
+        return db_utils.hash_file(path)
+
+    monkeypatch.setattr(indexer, "hash_file", counting_hash_file)
+    return indexer, note, hashed
+
+
+def test_index_obsidian_skips_unchanged_stat(vault) -> None:
+    indexer, note, hashed = vault
+    conn = db_utils.init_db()
+    try:
+        assert len(indexer.index_obsidian(conn, [str(note)])) == 1
+        assert len(hashed) == 1
+
+        # Same size and mtime: neither hashed nor reloaded
+        assert indexer.index_obsidian(conn, [str(note)]) == []
+        assert len(hashed) == 1
+    finally:
+        db_utils.close_db(conn)
+
+
+def test_index_obsidian_touched_file_keeps_hash(vault) -> None:
+    indexer, note, hashed = vault
+    conn = db_utils.init_db()
+    try:
+        indexer.index_obsidian(conn, [str(note)])
+        first = db_utils.get_file_record(conn, "note.md")
+
+        st = os.stat(note)
+        os.utime(note, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        # mtime moved, so the file is re-hashed, but unchanged content is not reloaded
+        assert indexer.index_obsidian(conn, [str(note)]) == []
+        assert len(hashed) == 2
+        second = db_utils.get_file_record(conn, "note.md")
+        assert second[0] == first[0]
+        assert second[3] == st.st_mtime_ns + 1_000_000_000
+    finally:
+        db_utils.close_db(conn)
@@ -1,4 +1,5 @@
 import json
+import threading
 from unittest.mock import AsyncMock, patch
 
 import langsmith
@@ -354,3 +355,41 @@ def test_info(test_client, mock_settings) -> None:
 
     assert output.default_model == OpenAIModelName.GPT_4O_MINI
     assert output.models == [OpenAIModelName.GPT_4O, OpenAIModelName.GPT_4O_MINI]
+
+
+def test_obsidian_index(test_client) -> None:
+    """Test that /obsidian/index accepts the request and runs the index in the background."""
+    with patch("plugins.obsidian.route.run_index") as mock_run_index:
+        response = test_client.get("/obsidian/index")
+
+    assert response.status_code == 202
+    assert response.json()["status"] == "accepted"
+    mock_run_index.assert_called_once()
+
+
+def test_obsidian_index_failure_is_logged(test_client, caplog) -> None:
+    """Test that a failed background index run logs its traceback and releases the lock."""
+    with (
+        patch("plugins.obsidian.route._index_lock", threading.Lock()) as index_lock,
+        patch("plugins.obsidian.route.run_index", side_effect=RuntimeError("boom")),
+    ):
+        response = test_client.get("/obsidian/index")
+        assert not index_lock.locked()
+
+    assert response.status_code == 202
+    record = next(r for r in caplog.records if r.getMessage() == "Obsidian index failed")
+    assert record.exc_info[0] is RuntimeError
+
+
+def test_obsidian_index_already_running(test_client) -> None:
+    """Test that /obsidian/index does not start a second run while one is in progress."""
+    with (
+        patch("plugins.obsidian.route._index_lock") as mock_lock,
+        patch("plugins.obsidian.route.run_index") as mock_run_index,
+    ):
+        mock_lock.acquire.return_value = False
+        response = test_client.get("/obsidian/index")
+
+    assert response.status_code == 409
+    assert response.json()["status"] == "running"
+    mock_run_index.assert_not_called()